@@ -11,7 +11,9 @@ app = typer.Typer(no_args_is_help=True)
 def show() -> None:
     """Logs the configuration."""
     container = get_container()
-    rich.print(container.configuration.model_dump())
+    # model_dump_json serializes in pydantic's Rust core in one pass, instead of
+    # materializing a Python dict for rich's pretty printer to re-walk.
+    rich.print_json(container.configuration.model_dump_json())
 
 
 @app.command()
@@ -5,17 +5,10 @@ from typing import Annotated
 import rich
 import rich.emoji
 import typer
-from rich.console import Console
 
-from memer.utils.images import MemeText
-from memer.utils.images import create_meme
-from memer.utils.images import generate_meme_name
-from memer.utils.images import load_image
 from memer.utils.settings import Template
 from memer.core.container import get_container
 
-console = Console()
-
 logger = logging.getLogger(__name__)
 
 app = typer.Typer(no_args_is_help=True)
@@ -51,32 +44,53 @@ def create(
             help="The path where the generated meme will be saved.",
         ),
     ] = None,
+    draft: Annotated[
+        bool,
+        typer.Option(
+            "--draft",
+            help="Skip the contrast stroke around the text for a faster draft render.",
+        ),
+    ] = False,
 ) -> None:
     """Create a meme using the specified template and text options."""
+    # Imported here so that commands not touching images (e.g. --help, templates list)
+    # do not pay the PIL import cost.
+    from memer.utils.images import MemeText
+    from memer.utils.images import create_meme
+    from memer.utils.images import generate_meme_name
+    from memer.utils.images import load_image
+
     # TODO(Matez): add option such that if tempalte name is not provided, we open the search window
     # TODO(Matez): add option to customize font size, font color, etc.
 
     # TODO(Matez): catch exception and raise nicer one
 
+    container = get_container()
+
     # Case where user provided a path to the template
-    if Path(template_name).is_file():
-        template = Template(path=Path(template_name))
-        image = load_image(file_path=template_name)
+    template_path = Path(template_name)
+    if template_path.is_file():
+        template = Template(path=template_path)
 
     # In all other cases, we load it by name
     else:
-        container = get_container()
         template = container.configuration.images.templates.discovered_templates[template_name]
-        image = load_image(file_path=template.path)
+
+    image = load_image(file_path=template.path)
+
+    text_configuration = container.configuration.text
+    if draft:
+        text_configuration = text_configuration.model_copy(update={"stroke_width": 0})
 
     meme = create_meme(
         image=image,
         meme_text=MemeText(top_text=top_text, bottom_text=bottom_text),
-        text_configuration=container.configuration.text,
+        text_configuration=text_configuration,
     )
     # Current working directory / meme template name (path stem) + date. png
-    default_output_path = generate_meme_name(template_stem=template.path.stem)
-    saved_path = (output_path if output_path else default_output_path).resolve()
+    saved_path = (
+        output_path if output_path else generate_meme_name(template_stem=template.path.stem)
+    ).resolve()
 
     meme.save(saved_path)
 
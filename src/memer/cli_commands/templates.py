@@ -1,25 +1,24 @@
 import logging
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
+from operator import attrgetter
 from pathlib import Path
 from typing import Annotated
 
 import rich
 import typer
-from requests.exceptions import RequestException
-from rich.console import Console
 from rich.progress import track
 from rich.table import Table
 
 # TODO(Mateusz): we need to fix those implicit relative imports...
-from memer.utils.remote_templates import pull_image_from_url
+from memer.utils.console import console
 from memer.utils.settings import Template
 from memer.utils.settings import TemplateToPull
 from memer.core.container import get_container
 from memer.utils.settings import get_user_data_templates_path
 from memer.utils.settings import load_default_template_list
 
-console = Console()
-
 logger = logging.getLogger(__name__)
 
 app = typer.Typer(no_args_is_help=True)
@@ -118,38 +117,24 @@ def pull(
 
     # This is a single file case:
 
-    to_pull_set = set(to_pull_list)
-    rich.print(f"[bold]Pulling {len(to_pull_set)} templates:[/bold]")
+    # Deduplicate by URL (first occurrence wins) - pulling the same URL twice
+    # would just overwrite the same file.
+    to_pull_by_url: dict[str, TemplateToPull] = {}
+    for template_to_pull in to_pull_list:
+        to_pull_by_url.setdefault(template_to_pull.url, template_to_pull)
+    rich.print(f"[bold]Pulling {len(to_pull_by_url)} templates:[/bold]")
 
-    # TODO(Mateusz): this should be async
-    failed_downloads: list[list[str | None]] = []
-    for meme_to_pull in track(to_pull_set, description="Pulling templates..."):
-        logger.debug("Pulling template from URL: %s", str(meme_to_pull.url))
+    downloaded_paths, failed_downloads = _download_templates(
+        to_pull=to_pull_by_url.values(),
+        target_dir_path=user_data_template_path,
+    )
 
-        try:
-            container = get_container()
-            downloaded_template_path = pull_image_from_url(
-                url=meme_to_pull.url,
-                target_dir_path=user_data_template_path,
-                timeout=container.configuration.images.remote.timeout,
-                name=meme_to_pull.name,
-                verify_ssl=container.configuration.images.remote.verify_ssl,
-            )
-            rich.print(
-                f"[bold]Template downloaded to:[/bold] {downloaded_template_path}")
-
-        except RequestException as e:
-            failed_downloads.append([meme_to_pull.name, meme_to_pull.url])
-            logger.debug(
-                "Failed to pull template %s " "from URL: %s (%s)",
-                meme_to_pull.name,
-                meme_to_pull.url,
-                e,
-            )
-            continue
-
-    rich.print(f"Successfully pulled {
-               len(to_pull_list)-len(failed_downloads)} templates")
+    if downloaded_paths:
+        rich.print(
+            "[bold]Templates downloaded to:[/bold]\n"
+            + "\n".join(str(path) for path in downloaded_paths)
+        )
+    rich.print(f"Successfully pulled {len(downloaded_paths)} templates")
     if failed_downloads:
         rich.print(
             "[yellow]Error while pulling templates (please check " "the provided URL(s)):[/yellow]"
@@ -163,13 +148,78 @@ def pull(
         console.print(table)
 
 
+def _download_templates(
+    to_pull: Iterable[TemplateToPull],
+    target_dir_path: Path,
+) -> tuple[list[Path], list[list[str | None]]]:
+    """Downloads the given templates concurrently.
+
+    Downloads are I/O bound, so they are issued concurrently instead of
+    paying one round trip after another.
+
+    Args:
+        to_pull (Iterable[TemplateToPull]): The templates to download.
+        target_dir_path (Path): The directory to save the templates to.
+
+    Returns:
+        tuple: The saved paths and the (name, url) pairs that failed.
+    """
+    # Imported here so that commands not doing any networking do not pay
+    # the requests import cost.
+    from requests.exceptions import RequestException
+
+    from memer.utils.remote_templates import pull_image_from_url
+
+    remote_configuration = get_container().configuration.images.remote
+    downloaded_paths: list[Path] = []
+    failed_downloads: list[list[str | None]] = []
+    with ThreadPoolExecutor(max_workers=remote_configuration.max_workers) as executor:
+        future_to_template = {
+            executor.submit(
+                pull_image_from_url,
+                url=meme_to_pull.url,
+                target_dir_path=target_dir_path,
+                timeout=remote_configuration.timeout,
+                name=meme_to_pull.name,
+                verify_ssl=remote_configuration.verify_ssl,
+            ): meme_to_pull
+            for meme_to_pull in to_pull
+        }
+        for future in track(
+            as_completed(future_to_template),
+            total=len(future_to_template),
+            description="Pulling templates...",
+        ):
+            meme_to_pull = future_to_template[future]
+            logger.debug("Pulling template from URL: %s", str(meme_to_pull.url))
+            try:
+                # Buffered instead of printed here: rendering markup while
+                # track() redraws the progress bar would fight for the console.
+                downloaded_paths.append(future.result())
+
+            except RequestException as e:
+                failed_downloads.append([meme_to_pull.name, meme_to_pull.url])
+                logger.debug(
+                    "Failed to pull template %s " "from URL: %s (%s)",
+                    meme_to_pull.name,
+                    meme_to_pull.url,
+                    e,
+                )
+                continue
+    return downloaded_paths, failed_downloads
+
+
 def _echo_templates(templates: Iterable[Template], attributes: list[str]) -> None:
     table = Table(*attributes, title="Templates")
 
+    # attrgetter is C-implemented, so per-row attribute access skips the
+    # Python-level getattr loop. With a single attribute it returns the bare
+    # value instead of a tuple, hence the tuple wrap below.
+    getter = attrgetter(*attributes)
+    single = len(attributes) == 1
     for template in templates:
-        values = [str(getattr(template, attribute))
-                  for attribute in attributes]
-        table.add_row(*values)
+        values = (getter(template),) if single else getter(template)
+        table.add_row(*(str(value) for value in values))
     console.print(table)
 
 
@@ -179,7 +229,8 @@ def _phrase_present_in_template(template: Template, phrase: str) -> bool:
     This function searches for the phrase in a sanitized version of the
     template's name, key, and path, as well as in the original concatenated
     string of these attributes. The search is case-insensitive and ignores
-    certain special characters by replacing them with spaces.
+    certain special characters. Both search bodies are cached on the template,
+    so repeated searches do not rebuild them.
 
     Args:
         template (Template): The template object containing name, key, and path attributes.
@@ -190,14 +241,8 @@ def _phrase_present_in_template(template: Template, phrase: str) -> bool:
     """
     # TODO(Mateusz): This search could be more clever.
     # It could also return number of "hits" to rank the results.
-    search_body = (template.name + template.key + str(template.path)).lower()
-    sanitized_body = (
-        search_body.replace("-", " ")
-        .replace("_", " ")
-        .replace(".", " ")
-        .replace("/", " ")
-        .replace("\\", " ")
-        .replace(" ", "")
-    )
-
-    return phrase in sanitized_body + search_body
+    # Check the raw body first: if it already matches, the (lazily computed)
+    # sanitized body is never built.
+    if phrase in template.search_body:
+        return True
+    return phrase in template.sanitized_search_body
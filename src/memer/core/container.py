@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
 from typing import Protocol
 
@@ -53,16 +54,19 @@ class Container:
         return self._config_provider.get_configuration()
 
 
-# Default container instance
+# Explicit override set via set_container(); checked before the cached default.
 _default_container: Container | None = None
 
 
+@functools.cache
+def _build_default_container() -> Container:
+    """Build the lazily created default container exactly once."""
+    return Container()
+
+
 def get_container() -> Container:
     """Get the default container instance."""
-    global _default_container  # noqa: PLW0603
-    if _default_container is None:
-        _default_container = Container()
-    return _default_container
+    return _default_container or _build_default_container()
 
 
 def set_container(container: Container) -> None:
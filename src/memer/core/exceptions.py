@@ -15,6 +15,8 @@ logger = logging.getLogger(__name__)
 class MemerError(Exception):
     """Base exception for all memer-related errors."""
 
+    __slots__ = ("cause", "message")
+
     def __init__(self, message: str, cause: Exception | None = None) -> None:
         """Initialize the exception.
         
@@ -30,22 +32,32 @@ class MemerError(Exception):
 class ConfigurationError(MemerError):
     """Error related to configuration loading or validation."""
 
+    __slots__ = ()
+
 
 class TemplateError(MemerError):
     """Error related to template operations."""
 
+    __slots__ = ()
+
 
 class ImageProcessingError(MemerError):
     """Error related to image processing operations."""
 
+    __slots__ = ()
+
 
 class NetworkError(MemerError):
     """Error related to network operations."""
 
+    __slots__ = ()
+
 
 class ValidationError(MemerError):
     """Error related to input validation."""
 
+    __slots__ = ()
+
 
 def setup_exception_handler(debug: bool = False) -> None:
     """Set up global exception handler.
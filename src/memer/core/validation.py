@@ -2,13 +2,33 @@
 
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 from typing import Any
-from urllib.parse import urlparse
 
 from memer.core.exceptions import ValidationError
 
+# Precompiled patterns so hot paths skip the re module's per-call cache lookup.
+_INVALID_NAME_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+_FILENAME_SANITIZE_RE = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
+
+# Keys and substrings that might indicate code injection in configuration files.
+# The frozenset gives O(1) key membership; the alternation scans string values
+# in a single pass instead of one substring search per keyword.
+_SUSPICIOUS_KEYS = frozenset({"__import__", "__builtins__", "exec", "eval", "compile"})
+_SUSPICIOUS_RE = re.compile("|".join(re.escape(key) for key in sorted(_SUSPICIOUS_KEYS)))
+
+# Scheme://netloc[/path] shape check. One C-level match instead of urlparse's
+# multiple Python-level splits; pays off when pull --from-file validates many URLs.
+_URL_RE = re.compile(r"^([A-Za-z][A-Za-z0-9+.-]*)://([^/\s]+)(/\S*)?$")
+
+# Translation table deleting control characters (except newline, tab and carriage
+# return) in a single pass, without invoking the regex engine.
+_CONTROL_CHARS_TABLE = dict.fromkeys(
+    [*range(0x09), 0x0B, 0x0C, *range(0x0E, 0x20), 0x7F]
+)
+
 
 def validate_file_path(path: str | Path, must_exist: bool = True) -> Path:
     """Validate and sanitize a file path.
@@ -24,16 +44,25 @@ def validate_file_path(path: str | Path, must_exist: bool = True) -> Path:
         ValidationError: If the path is invalid or unsafe.
     """
     # Security check: prevent path traversal attacks before resolution
-    if ".." in str(path) or str(path).startswith("/etc") or str(path).startswith("/proc"):
+    path_str = os.fspath(path)
+    if ".." in path_str or path_str.startswith(("/etc", "/proc")):
         raise ValidationError(f"Unsafe file path: {path}")
 
     try:
-        file_path = Path(path).resolve()
-    except (OSError, ValueError) as e:
+        # realpath resolves the symlink chain in one pass, cheaper than
+        # Path.resolve() which stats every parent segment. Non-strict
+        # realpath swallows OSError itself; only malformed input such as
+        # an embedded null byte still raises.
+        file_path = Path(os.path.realpath(path))
+    except ValueError as e:
         raise ValidationError(f"Invalid file path: {path}") from e
 
-    if must_exist and not file_path.exists():
-        raise ValidationError(f"File does not exist: {path}")
+    if must_exist:
+        try:
+            # Single stat call instead of a separate exists() round trip.
+            os.stat(file_path)  # noqa: PTH116
+        except OSError as e:
+            raise ValidationError(f"File does not exist: {path}") from e
 
     return file_path
 
@@ -60,7 +89,7 @@ def validate_template_name(name: str) -> str:
         raise ValidationError("Template name too long (max 255 characters)")
 
     # Check for invalid characters (basic safety)
-    if re.search(r'[<>:"/\\|?*\x00-\x1f]', name):
+    if _INVALID_NAME_RE.search(name):
         raise ValidationError("Template name contains invalid characters")
 
     return name
@@ -83,16 +112,13 @@ def validate_url(url: str) -> str:
 
     url = url.strip()
 
-    try:
-        parsed = urlparse(url)
-    except Exception as e:
-        raise ValidationError(f"Invalid URL format: {url}") from e
-
-    if not parsed.scheme or not parsed.netloc:
+    match = _URL_RE.match(url)
+    if match is None:
         raise ValidationError(f"Invalid URL format: {url}")
 
-    if parsed.scheme not in ("http", "https"):
-        raise ValidationError(f"Unsupported URL scheme: {parsed.scheme}")
+    scheme = match.group(1).lower()
+    if scheme not in ("http", "https"):
+        raise ValidationError(f"Unsupported URL scheme: {scheme}")
 
     return url
 
@@ -117,9 +143,7 @@ def validate_text_input(text: str, max_length: int = 1000) -> str:
         raise ValidationError(f"Text too long (max {max_length} characters)")
 
     # Remove any control characters except newlines and tabs
-    cleaned = re.sub(r"[\x00-\x08\x0b-\x0c\x0e-\x1f\x7f]", "", text)
-
-    return cleaned
+    return text.translate(_CONTROL_CHARS_TABLE)
 
 
 def sanitize_filename(filename: str) -> str:
@@ -135,7 +159,7 @@ def sanitize_filename(filename: str) -> str:
         return "untitled"
 
     # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*\x00-\x1f]', "_", filename)
+    sanitized = _FILENAME_SANITIZE_RE.sub("_", filename)
 
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(" .")
@@ -163,19 +187,16 @@ def validate_configuration_dict(config: dict[str, Any]) -> dict[str, Any]:
     Raises:
         ValidationError: If the configuration contains security issues.
     """
-    # Check for suspicious keys that might indicate code injection
-    suspicious_keys = {"__import__", "__builtins__", "exec", "eval", "compile"}
-
     def check_dict(d: dict[str, Any], path: str = "") -> None:
         for key, value in d.items():
             current_path = f"{path}.{key}" if path else key
 
-            if key in suspicious_keys:
+            if key in _SUSPICIOUS_KEYS:
                 raise ValidationError(f"Suspicious configuration key: {current_path}")
 
             if isinstance(value, dict):
                 check_dict(value, current_path)
-            elif isinstance(value, str) and any(sus in value for sus in suspicious_keys):
+            elif isinstance(value, str) and _SUSPICIOUS_RE.search(value):
                 raise ValidationError(f"Suspicious configuration value at: {current_path}")
 
     check_dict(config)
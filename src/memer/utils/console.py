@@ -0,0 +1,7 @@
+"""Shared rich console for the CLI command modules."""
+
+from rich.console import Console
+
+# A single shared instance, so terminal capability probing (isatty, env vars,
+# color detection) happens once per process instead of once per module.
+console = Console()
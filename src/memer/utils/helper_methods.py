@@ -1,3 +1,5 @@
+import functools
+import re
 import sys
 import traceback
 from collections.abc import Callable
@@ -10,6 +12,13 @@ from .memer_exceptions import TyperCommandGetterError
 
 logger = getLogger(name=__name__)
 
+# Matches the boundary before an uppercase letter that does not already follow
+# a space - the same rule the old per-character loop implemented.
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r"(?<=[^ ])(?=[A-Z])")
+
+# Translation table turning underscores and hyphens into spaces in one pass.
+_SEPARATORS_TO_SPACES_TABLE = str.maketrans({"_": " ", "-": " "})
+
 # Custom exception handler
 
 
@@ -40,14 +49,10 @@ def split_camel_case_words(camel_case_string: str) -> str:
     Returns:
         str: A string with words separated by spaces.
     """
-    nice_name = ""
-    for char in camel_case_string:
-        if char.isupper() and nice_name and nice_name[-1] != " ":
-            nice_name += " "
-        nice_name += char
-    return nice_name
+    return _CAMEL_CASE_BOUNDARY_RE.sub(" ", camel_case_string)
 
 
+@functools.lru_cache(maxsize=4096)
 def convert_string_to_nice_name(source_name: str) -> str:
     """Converts a given string to a more readable 'nice' name.
 
@@ -56,6 +61,10 @@ def convert_string_to_nice_name(source_name: str) -> str:
     2. Splits camel case words into separate words.
     3. Capitalizes each word.
 
+    A pure function of its input, so results are memoized: template
+    discovery calls it once per file and name accesses repeat the same
+    stems.
+
     Args:
         source_name (str): The original string to be converted.
 
@@ -63,11 +72,37 @@ def convert_string_to_nice_name(source_name: str) -> str:
         str: The converted 'nice' name.
     """
     # Replace underscores and hyphens with spaces
-    nice_name = source_name.replace("_", " ").replace("-", " ")
+    nice_name = source_name.translate(_SEPARATORS_TO_SPACES_TABLE)
 
     nice_name = split_camel_case_words(camel_case_string=nice_name)
-    # Capitalize each word
-    return " ".join(word.capitalize() for word in nice_name.split())
+    # Collapse whitespace, then capitalize each word in one C-level pass.
+    # (str.title treats apostrophes as word breaks - fine for template names.)
+    return " ".join(nice_name.split()).title()
+
+
+@functools.cache
+def _command_index(
+    app: typer.Typer,
+) -> tuple[dict[str | None, typer.models.CommandInfo], frozenset[str | None]]:
+    """Index an app's registered commands by name, noting duplicated names.
+
+    Built once per Typer app, so repeated lookups are hash lookups instead
+    of a linear scan over the command list.
+
+    Args:
+        app (typer.Typer): The Typer application to index.
+
+    Returns:
+        tuple: A name-to-command mapping and the set of duplicated names.
+    """
+    index: dict[str | None, typer.models.CommandInfo] = {}
+    duplicated_names: set[str | None] = set()
+    for command in app.registered_commands:
+        if command.name in index:
+            duplicated_names.add(command.name)
+        else:
+            index[command.name] = command
+    return index, frozenset(duplicated_names)
 
 
 def get_typer_command_by_name(app: typer.Typer, command_name: str) -> Callable[..., None]:
@@ -80,21 +115,20 @@ def get_typer_command_by_name(app: typer.Typer, command_name: str) -> Callable[.
     Returns:
         Callable[..., None]: The command function.
     """
-    discovered_commands: list[typer.models.CommandInfo] = [
-        command for command in app.registered_commands if command.name == command_name
-    ]
-    if len(discovered_commands) > 1:
+    index, duplicated_names = _command_index(app)
+    if command_name in duplicated_names:
         error_message = f"Multiple commands with the name '{
             command_name}' found."
         raise TyperCommandGetterError(error_message)
 
-    if not discovered_commands:
+    discovered_command = index.get(command_name)
+    if discovered_command is None:
         error_message = f"No command with the name '{command_name}' found."
         raise TyperCommandGetterError(error_message)
 
-    if discovered_commands[0].callback is None:
+    if discovered_command.callback is None:
         error_message = f"The command '{
             command_name}' has no function associated with it."
         raise TyperCommandGetterError(error_message)
 
-    return discovered_commands[0].callback
+    return discovered_command.callback
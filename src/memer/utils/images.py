@@ -1,23 +1,47 @@
+import functools
 import logging
-import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-import pytz
 from PIL import Image
 from PIL import ImageDraw
 from PIL import ImageFont
 
 from memer.utils.memer_exceptions import MemeGenerationError
-from memer.utils.settings import MarginsConfiguration
 from memer.utils.settings import TextConfiguration
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import: the local zone does not change mid-process, and the
+# lookup would otherwise run for every generated meme name.
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
 
-@dataclass
+# Reference size for the analytic font-size estimate in _determine_font_size.
+_PROBE_FONT_SIZE = 100
+
+
+@functools.lru_cache(maxsize=512)
+def _load_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a font, reusing already constructed FreeType faces.
+
+    Every ImageFont.truetype call re-reads and re-parses the TTF file; the
+    font-size search asks for the same (path, size) pairs repeatedly, so the
+    cache turns those into dict lookups.
+
+    Args:
+        font_path (str): The path to the font file.
+        size (int): The font size in points.
+
+    Returns:
+        ImageFont.FreeTypeFont: The loaded font.
+    """
+    return ImageFont.truetype(font_path, size)
+
+
+@dataclass(slots=True)
 class MemeText:
     """A class to represent meme text with optional top and bottom text and a font.
 
@@ -33,21 +57,10 @@ class MemeText:
     font: ImageFont.FreeTypeFont | None = None
 
     def __post_init__(self) -> None:
-        """Post-initialization method to perform additional setup after the object is created.
-
-        This method is automatically called after the object's initialization to validate
-        the text attribute of the instance.
-
-        Returns:
-            None
-        """
-        self._validate_text()
-
-    def _validate_text(self) -> None:
         """Validates that at least one of 'top_text' or 'bottom_text' is provided and not empty.
 
         Raises:
-            ValueError: If both 'top_text' and 'bottom_text' are None or empty.
+            MemeGenerationError: If both 'top_text' and 'bottom_text' are None or empty.
         """
         if not (self.top_text or self.bottom_text):
             error_message = (
@@ -70,7 +83,11 @@ def load_image(file_path: Path | str) -> Image.Image:
     Example usage:
     >>> image = load_image("distracted_boyfriend.jpg")
     """
-    return Image.open(file_path)
+    # Image.open is lazy and keeps the file descriptor alive until GC; decode
+    # eagerly and hand back a detached copy so the file is closed right away.
+    with Image.open(file_path) as image:
+        image.load()
+        return image.copy()
 
 
 def create_meme(
@@ -106,39 +123,95 @@ def create_meme(
     """
     font = meme_text.font
     if font is None:
-        font_size_candidates: list[int] = []
-        if meme_text.top_text is not None:
-            font_size_candidates.append(
-                _determine_font_size(
-                    image=image,
-                    text=meme_text.top_text,
-                    font_path=text_configuration.font.font_path,
-                    text_configuration=text_configuration,
-                )
-            )
-        if meme_text.bottom_text is not None:
-            font_size_candidates.append(
-                _determine_font_size(
-                    image=image,
-                    text=meme_text.bottom_text,
-                    font_path=text_configuration.font.font_path,
-                    text_configuration=text_configuration,
-                )
-            )
-        logger.debug("Font size candidates: %s", font_size_candidates)
-
-        font_size = min(font_size_candidates)
+        texts = [text for text in (meme_text.top_text, meme_text.bottom_text) if text is not None]
+        font_size = _determine_font_size(
+            image=image,
+            texts=texts,
+            font_path=text_configuration.font.font_path,
+            text_configuration=text_configuration,
+        )
 
         logger.debug("Selected font size: %s", font_size)
 
-        font = ImageFont.truetype(text_configuration.font.font_path, font_size)
+        font = _load_font(str(text_configuration.font.font_path), font_size)
     return _add_text_to_image(
         image=image,
         font=font,
         top_text=meme_text.top_text,
         bottom_text=meme_text.bottom_text,
-        margins=text_configuration.margins,
+        text_configuration=text_configuration,
+    )
+
+
+def _create_and_save_meme(
+    template_path: Path,
+    meme_text: MemeText,
+    output_path: Path,
+    *,
+    text_configuration: TextConfiguration,
+) -> Path:
+    """Load a template, render the meme and save it. Runs inside pool workers."""
+    image = load_image(file_path=template_path)
+    meme = create_meme(image=image, meme_text=meme_text, text_configuration=text_configuration)
+    meme.save(output_path)
+    return output_path
+
+
+def _unique_output_paths(jobs: list[tuple[Path, MemeText]], out_dir: Path | None) -> list[Path]:
+    """Names one output path per job, suffixing clashes with a counter.
+
+    generate_meme_name only has second-granularity timestamps, so jobs
+    sharing a template stem would collide and overwrite each other. Names
+    are assigned up front in the parent process, where collisions can be
+    detected deterministically before any worker writes.
+    """
+    output_paths: list[Path] = []
+    used: set[Path] = set()
+    for template_path, _ in jobs:
+        base = generate_meme_name(template_stem=template_path.stem, out_dir=out_dir).resolve()
+        candidate = base
+        counter = 1
+        while candidate in used:
+            candidate = base.with_stem(f"{base.stem}_{counter}")
+            counter += 1
+        used.add(candidate)
+        output_paths.append(candidate)
+    return output_paths
+
+
+def create_memes_batch(
+    jobs: list[tuple[Path, MemeText]],
+    text_configuration: TextConfiguration,
+    out_dir: Path | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Creates and saves many memes in parallel across worker processes.
+
+    Meme generation is CPU bound (rasterization and PNG encoding) and fully
+    independent per template, so a process pool sidesteps the GIL and scales
+    with cores. Jobs carry template paths rather than Image objects because
+    paths pickle cheaply; each worker decodes its own template. MemeText
+    entries must not carry a preloaded font (FreeType faces do not pickle).
+
+    Args:
+        jobs (list[tuple[Path, MemeText]]): Template path and text per meme.
+        text_configuration (TextConfiguration): Shared text configuration.
+        out_dir (Path | None): Directory for the generated memes.
+            Defaults to the current working directory.
+        max_workers (int | None): Worker process count. Defaults to the CPU count.
+
+    Returns:
+        list[Path]: The saved meme paths, in job order.
+    """
+    output_paths = _unique_output_paths(jobs=jobs, out_dir=out_dir)
+    worker = functools.partial(
+        _create_and_save_meme,
+        text_configuration=text_configuration,
     )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(worker, (job[0] for job in jobs), (job[1] for job in jobs), output_paths)
+        )
 
 
 def _add_text_to_image(
@@ -146,7 +219,7 @@ def _add_text_to_image(
     font: ImageFont.FreeTypeFont,
     top_text: str | None,
     bottom_text: str | None,
-    margins: MarginsConfiguration,
+    text_configuration: TextConfiguration,
 ) -> Image.Image:
     """Adds text to the top and bottom of an image.
 
@@ -157,7 +230,9 @@ def _add_text_to_image(
         If None, no text is added at the top.
         bottom_text (str | None): The text to be added at the bottom of the image.
         If None, no text is added at the bottom.
-        margins (MarginsConfiguration): Configuration for the margins around the text.
+        text_configuration (TextConfiguration): Configuration for the text,
+        including margins and the contrast stroke. Pillow renders the glyphs
+        once per stroke offset, so a stroke width of 0 skips that work entirely.
 
     Returns:
         Image.Image: The image with the added text.
@@ -168,21 +243,27 @@ def _add_text_to_image(
     >>> image_with_text = add_text_to_image(image, font, "Me", "New project idea | Current project")
     >>> image_with_text.show()
     """
-    draw = ImageDraw.Draw(image)
+    if top_text is None and bottom_text is None:
+        return image
+
+    margins = text_configuration.margins
+    draw_text = ImageDraw.Draw(image).text
+    text_kwargs: dict[str, Any] = {"font": font, "fill": "white"}
+    if text_configuration.stroke_width:
+        text_kwargs["stroke_width"] = text_configuration.stroke_width
+        text_kwargs["stroke_fill"] = text_configuration.stroke_fill
 
     # Add text to image
     if top_text is not None:
-        # Calculate text size and position for top text
+        # Measured with _get_text_size like the bottom text, so both blocks
+        # center on the same (rasterized) width definition
         top_text_width, _ = _get_text_size(text=top_text, font=font)
         top_text_position = ((image.width - top_text_width) / 2, margins.vertical)
 
-        draw.text(  # type: ignore Ignoring return type of draw.text
+        draw_text(  # type: ignore Ignoring return type of draw.text
             top_text_position,
             top_text,
-            font=font,
-            fill="white",
-            stroke_width=2,
-            stroke_fill="black",
+            **text_kwargs,
         )
     if bottom_text is not None:
         # Calculate text size and position for bottom text
@@ -191,18 +272,16 @@ def _add_text_to_image(
             (image.width - bottom_text_width) / 2,
             image.height - bottom_text_height - margins.vertical,
         )
-        draw.text(  # type: ignore Ignoring return type of draw.text
+        draw_text(  # type: ignore Ignoring return type of draw.text
             bottom_text_position,
             bottom_text,
-            font=font,
-            fill="white",
-            stroke_width=2,
-            stroke_fill="black",
+            **text_kwargs,
         )
 
     return image
 
 
+@functools.lru_cache(maxsize=1024)
 def _get_text_size(text: str, font: ImageFont.FreeTypeFont) -> tuple[float | int, float | int]:
     """Calculates the width and height of a line of text.
 
@@ -211,6 +290,10 @@ def _get_text_size(text: str, font: ImageFont.FreeTypeFont) -> tuple[float | int
     "How to properly calculate text size in PIL images" by José Fernando Costa
     https://levelup.gitconnected.com/how-to-properly-calculate-text-size-in-pil-images-17a2cc6f51fd
 
+    The text is rasterized once per (text, font) pair: a single getmask call
+    yields both dimensions, and results are memoized because the font-size
+    search and the final draw measure the same strings repeatedly.
+
     Args:
         text (str): The text string to be measured.
         font (ImageFont.FreeTypeFont): The font used to render the text.
@@ -221,8 +304,9 @@ def _get_text_size(text: str, font: ImageFont.FreeTypeFont) -> tuple[float | int
     _, descent = font.getmetrics()
 
     # Type of "getmask" is partially unknown
-    width: float | int | Any = font.getmask(text=text).getbbox()[2]  # type: ignore[no-untyped-call]
-    height: float | int | Any = font.getmask(text=text).getbbox()[3] + descent  # type: ignore[no-untyped-call]
+    bounding_box = font.getmask(text=text).getbbox()  # type: ignore[no-untyped-call]
+    width: float | int | Any = bounding_box[2]
+    height: float | int | Any = bounding_box[3] + descent
     if not isinstance(width, float | int) or not isinstance(height, float | int):
         message = (
             "Both width and height should be floats. "
@@ -232,6 +316,27 @@ def _get_text_size(text: str, font: ImageFont.FreeTypeFont) -> tuple[float | int
     return width, height
 
 
+@functools.lru_cache(maxsize=1024)
+def _measure_text(text: str, font: ImageFont.FreeTypeFont) -> tuple[float | int, float | int]:
+    """Measures text from font metrics without rasterizing any glyphs.
+
+    getlength/getbbox read advance widths straight from the font tables,
+    which is far cheaper than the getmask-based _get_text_size that renders
+    the string to a bitmap. Used by the font-size search, where only
+    approximate dimensions are needed.
+
+    Args:
+        text (str): The text string to be measured.
+        font (ImageFont.FreeTypeFont): The font used to render the text.
+
+    Returns:
+        tuple[float | int, float | int]: The width and height of the text.
+    """
+    _, descent = font.getmetrics()
+    bounding_box = font.getbbox(text)
+    return font.getlength(text), bounding_box[3] - bounding_box[1] + descent
+
+
 def _line_fits(text: str, font: ImageFont.FreeTypeFont, max_width: int, max_height: int) -> bool:
     """Determines if a given text fits within specified width and height.
 
@@ -244,77 +349,98 @@ def _line_fits(text: str, font: ImageFont.FreeTypeFont, max_width: int, max_heig
     Returns:
         bool: True if the text fits within both the specified width and height, False otherwise.
     """
-    text_width, text_height = _get_text_size(text, font)
+    text_width, text_height = _measure_text(text=text, font=font)
     width_fits = text_width <= max_width
 
     height_fits = text_height < max_height
 
-    logger.debug(
-        "Font size: %s, text width: %s, max width: %s, text height: %s, max height: %s",
-        font.size,
-        text_width,
-        max_width,
-        text_height,
-        max_height,
-    )
+    # Guarded: this sits in the innermost loop of the font-size search, and at
+    # the default log level the argument packing would be pure overhead.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Font size: %s, text width: %s, max width: %s, text height: %s, max height: %s",
+            font.size,
+            text_width,
+            max_width,
+            text_height,
+            max_height,
+        )
 
     return width_fits and height_fits
 
 
 def _determine_font_size(
     image: Image.Image,
-    text: str,
+    texts: list[str],
     font_path: str | Path,
     text_configuration: TextConfiguration,
 ) -> int:
-    """Guesses the font size that will fit the text in the image.
+    """Guesses the font size that will fit all given texts in the image.
+
+    Text dimensions scale nearly linearly with font size (the glyph metrics
+    are fixed, only the pixel size changes), so one measurement at a probe
+    size yields an analytic estimate of the largest fitting size. The
+    estimate is then verified and nudged by single steps to absorb rounding
+    and hinting effects - roughly two font loads in total instead of a
+    search over sizes.
 
     TODO(Mateusz): maybe add support for line breaking?
     """
-    font_size = 1  # font size is the text hight
-    font = ImageFont.truetype(font_path, font_size)
     max_width = image.width - 2 * text_configuration.margins.horizontal
     max_height = round(image.height * text_configuration.max_text_to_height_ratio)
 
+    def _all_lines_fit(font_size: int) -> bool:
+        font = _load_font(str(font_path), font_size)
+        return all(
+            _line_fits(text=text, font=font, max_width=max_width, max_height=max_height)
+            for text in texts
+        )
+
     # initial check:
-    if not _line_fits(
-        text=text,
-        font=font,
-        max_width=max_width,
-        max_height=max_height,
-    ):
+    if not _all_lines_fit(1):
         error_message = (
             "No font size matched for meme."
             "Hint: try max_text_to_height_ratio or decreasing margins."
         )
         raise MemeGenerationError(error_message)
-    # TODO(Mateusz): this search could be more clever
-    while _line_fits(
-        text=text,
-        font=font,
-        max_width=max_width,
-        max_height=max_height,
-    ):
-        font_size += 1
-        font = ImageFont.truetype(font_path, font_size)
-    return font_size - 1
 
+    largest_size = max(image.height, 2)
+    probe_font = _load_font(str(font_path), _PROBE_FONT_SIZE)
+
+    def _estimated_size(text: str) -> int:
+        width, height = _measure_text(text=text, font=probe_font)
+        size_by_width = int(_PROBE_FONT_SIZE * max_width / width) if width else largest_size
+        size_by_height = int(_PROBE_FONT_SIZE * max_height / height) if height else largest_size
+        return min(size_by_width, size_by_height)
+
+    estimated_size = min(_estimated_size(text) for text in texts)
+    font_size = max(min(estimated_size, largest_size), 1)
 
-def generate_meme_name(template_stem: str) -> Path:
+    # Absorb rounding/hinting nonlinearity around the estimate.
+    if _all_lines_fit(font_size):
+        while font_size < largest_size and _all_lines_fit(font_size + 1):
+            font_size += 1
+    else:
+        while font_size > 1 and not _all_lines_fit(font_size):
+            font_size -= 1
+    return font_size
+
+
+def generate_meme_name(template_stem: str, out_dir: Path | None = None) -> Path:
     """Generates a meme name based on the template name and the current date.
 
     Args:
         template_stem (str): The name of the template file.
+        out_dir (Path | None): The directory for the meme. Defaults to the
+            current working directory; batch callers can pass it once and
+            skip the per-call getcwd.
 
     Returns:
         str: A meme name based on the template name and the current date.
     """
-    local_nondst_tz = time.tzname[0]
-    current_time = datetime.now(tz=pytz.timezone(local_nondst_tz)).strftime(
-        format="%Y-%m-%d_%H-%M-%S"
-    )
+    current_time = datetime.now(tz=_LOCAL_TZ).strftime(format="%Y-%m-%d_%H-%M-%S")
 
-    return Path.cwd() / f"{template_stem}_{current_time}.png"
+    return (out_dir or Path.cwd()) / f"{template_stem}_{current_time}.png"
 
 
 if __name__ == "__main__":
@@ -1,9 +1,16 @@
 from pathlib import Path
 
 import requests
+import requests.adapters
 
 from .memer_exceptions import RemoteTemplateError
 
+# Shared session: keep-alive and connection pooling let bulk pulls to the same
+# host reuse one TCP/TLS connection instead of handshaking per download. The
+# pool size matches the default pull concurrency.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=8))
+
 
 def pull_image_from_url(
     *,
@@ -47,12 +54,20 @@ def pull_image_from_url(
     # Full path to save the image
     file_path = target_dir_path / name_without_spaces
 
-    # Download the image
-    response = requests.get(url=url, timeout=timeout, verify=verify_ssl)
-    response.raise_for_status()  # Ensure we notice bad responses
+    # Download the image, streaming chunks straight to disk so the whole body
+    # is never buffered in memory.
+    with _SESSION.get(url=url, timeout=timeout, verify=verify_ssl, stream=True) as response:
+        response.raise_for_status()  # Ensure we notice bad responses
 
-    # Save the image to the specified path
-    with file_path.open("wb") as file:
-        file.write(response.content)
+        # Save the image to the specified path. A transfer dying mid-body
+        # raises after chunks were already written; remove the truncated file
+        # so a failed download never leaves a corrupt template behind.
+        try:
+            with file_path.open("wb") as file:
+                for chunk in response.iter_content(chunk_size=64 * 1024):
+                    file.write(chunk)
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
 
     return file_path
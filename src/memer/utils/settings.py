@@ -1,464 +1,780 @@
-import hashlib
-import logging
-from functools import cached_property
-from pathlib import Path
-from typing import Annotated
-from typing import Any
-from typing import Self
-from typing import TypeVar
-
-import yaml
-from annotated_types import Gt
-from platformdirs import user_config_dir
-from platformdirs import user_data_dir
-from pydantic import BaseModel
-from pydantic import PlainSerializer
-
-from .helper_methods import convert_string_to_nice_name
-from .memer_exceptions import ConfigurationValidationError
-from .memer_exceptions import MissingConfigurationError
-
-logger = logging.getLogger(__name__)
-# TODO(Mateusz): this should probably go to setup.py?
-APP_NAME = "memer"
-
-# TODO(Mateusz): this file should be renamed to default_templates.yaml
-DEFAULT_MEMES_PATH = Path(__file__).parent.parent / "config" / "default_memes.yaml"
-
-DEFAULT_CONFIGURATION_PATH = (
-    Path(__file__).resolve().parent.parent / "config" / "default_configuration.yaml"
-)
-DEFAULT_FONT_PATH: Path = Path(__file__).resolve().parent.parent / "font"
-
-StringSerializedPath = Annotated[Path, PlainSerializer(lambda x: str(x), return_type=str)]
-
-
-# DEFAULT MEMES CLASSES
-class TemplateToPull(BaseModel):
-    """MemeToPull is a model representing a meme to be pulled.
-
-    Attributes:
-        name (str | None): The name of the meme. It can be None if the name is not provided.
-        url (str): The URL of the meme.
-    """
-
-    name: str | None
-    # TODO(Mateusz): maybe HttpUrl is type?
-    url: str
-
-    # Oveload eq, ne, hash to create template sets
-    def __eq__(self: Self, other: object) -> bool:
-        """Compare 2 instances of this class based on .name and .url properties."""
-        if isinstance(other, TemplateToPull):
-            return (self.name, self.url) == (other.name, other.url)
-        return False  # Objects of different types are not equal
-
-    def __ne__(self: Self, other: object) -> bool:
-        """Compare 2 instances of this class based on .name and .url properties."""
-        return not self.__eq__(other)
-
-    def __hash__(self: Self) -> int:
-        """Compute the hash of the object."""
-        return hash((self.name, self.url))
-
-
-class ToPullTemplates(BaseModel):
-    """DefaultTemplateList is a model that represents a list of meme templates.
-
-    Attributes:
-        templates (list[MemeToPull]): A list of MemeToPull objects representing the meme templates.
-    """
-
-    templates: list[TemplateToPull]
-
-
-# DEFAULT SETTINGS CLASSES
-class MarginsConfiguration(BaseModel):
-    """Margins class represents the vertical and horizontal margins.
-
-    Attributes:
-        vertical (int): The vertical margin in pixels.
-        horizontal (int): The horizontal margin in pixels.
-    """
-
-    vertical: int
-    horizontal: int
-
-
-class FontConfiguration(BaseModel):
-    """FontConfiguration is a class that represents the configuration for a font.
-
-    It includes fonts name, search paths, and file extension.
-
-    Attributes:
-        name (str): The name of the font. It can include (but does not have to) the file extension.
-        search_paths (set[Path]): A list of paths to search for the font file.
-        extension (str): The file extension of the font. Can be None
-
-    Methods:
-        _get_full_font_path(search_path: Path) -> Path:
-            Constructs the full path to the font file based on the search path and font name.
-        _font_exists(search_path: Path) -> bool:
-            Checks if the font file exists in the given search path.
-        font_path() -> Path:
-            Property that computes and returns the full path to the font file if it exists
-            in any of the search paths.
-            Raises FileNotFoundError if the font file is not found in any of the search paths.
-    """
-
-    name: str
-    search_paths: set[StringSerializedPath] = set()
-    extension: str | None = None
-
-    def _get_full_font_path(self, search_path: Path) -> Path:
-        # Case: font name includes the extension
-        if self.extension is not None and self.name.endswith(self.extension):
-            return search_path / self.name
-
-        # Case: font name does not include the extension
-        if self.extension is not None and not self.name.endswith(self.extension):
-            # Check if the extension includes the dot
-            if self.extension.startswith("."):
-                return search_path / f"{self.name}{self.extension}"
-            return search_path / f"{self.name}.{self.extension}"
-        # Case: extension is None, but no extension in the font name
-        # (which still could be a valid font path)
-        return search_path / self.name
-
-    def _font_exists(self, search_path: Path) -> bool:
-        font_path = self._get_full_font_path(search_path=search_path)
-        return font_path.exists()
-
-    @cached_property
-    def font_path(self) -> Path:
-        """Cached property for computed font path.
-
-        This property will search for the font file in the search paths and return the full path.
-        It will perform the search in the order from the settings.
-
-        Returns:
-            Path: The full path to the font if it exists in one of the search paths.
-
-        Raises:
-            ConfigurationValidationError: If the font is not found in any of the search paths.
-        """
-        # First try the built in path
-        if self._font_exists(DEFAULT_FONT_PATH):
-            return self._get_full_font_path(search_path=DEFAULT_FONT_PATH)
-
-        # Then try the search paths
-        for path in self.search_paths:
-            if self._font_exists(path):
-                return self._get_full_font_path(search_path=path)
-
-        error_message = f"Default font not found in any of the search paths. Looked at: {
-            DEFAULT_FONT_PATH} and at {self.search_paths}"
-        raise ConfigurationValidationError(error_message)
-
-
-class TextConfiguration(BaseModel):
-    """Text class represents the text configuration.
-
-    Attributes:
-        max_text_to_height_ratio (float): The maximum text to height ratio.
-        margins (Margins): An instance of the Margins class representing the margins configuration.
-    """
-
-    max_text_to_height_ratio: float
-    margins: MarginsConfiguration
-    font: FontConfiguration
-
-
-class Template(BaseModel):
-    """Template class representing a template file with a path.
-
-    Attributes:
-        path (Path): The file path of the template.
-
-    Properties:
-        name (str): A computed property that returns a nicely formatted name
-        derived from the file stem.
-        key (str): A computed property that returns a SHA-256 hash of the file path,
-        which remains consistent if the path does not change.
-    """
-
-    # TODO(Mateusz): think about it. Should it even be pydantic base class?
-    path: StringSerializedPath
-
-    @cached_property
-    def name(self) -> str:
-        """A user-friendly name from the file stem of the path.
-
-        Returns:
-            str: A user-friendly name derived from the file stem.
-        """
-        return convert_string_to_nice_name(source_name=self.path.stem)
-
-    @cached_property
-    def key(self) -> str:
-        # TODO(Mateusz): do we even need it?
-        """Property will stay the same if the path did not change.
-
-        Generates a SHA-256 hash of the file path.
-
-        Returns:
-            str: A SHA-256 hash of the file path.
-        """
-        # Maybe we should make it shorter?
-        return hashlib.sha256(str(self.path).encode()).hexdigest()
-
-    @cached_property
-    def stem(self) -> str:
-        """The file stem of the path.
-
-        Returns:
-            str: The file stem of the path.
-        """
-        return self.path.stem
-
-
-class TemplatesConfiguration(BaseModel):
-    """TemplatesConfiguration is a configuration class for managing template discovery.
-
-    Attributes:
-        extensions (list[str]): A list of file extensions to search for templates.
-        search_paths (list[Path]): A list of paths to search for template files.
-
-    Methods:
-        discovered_templates() -> dict[str, Template]:
-            Property with templates that are discovered from the search paths and extensions.
-    """
-
-    extensions: list[str]
-    search_paths: set[StringSerializedPath] = set()
-
-    @cached_property
-    def discovered_templates(self) -> dict[str, Template]:
-        """Property with templates that are discovered from the search paths and extensions.
-
-        Discovers and loads templates from the specified search paths and extensions.
-        This method iterates over the configured search paths and file extensions,
-        creating a Template object for each discovered file and storing it in a dictionary
-        with the template's key as the dictionary key.
-
-        Returns:
-            dict[str, Template]: A dictionary where the keys are template names and the values
-            are Template objects.
-        """
-        templates: dict[str, Template] = {}
-        # TODO(Mateusz): refactor this to maybe use a generator. Also too much nesting
-        # This is really tought to understad
-        for path in self.search_paths:
-            # Case that path is a file already
-            if path.is_file():
-                template = Template(path=path)
-                if template.name in templates:
-                    logger.warning(
-                        "Template name clash: %s and %s have the same name %s."
-                        "Proceeding with %s.",
-                        templates[template.name].path,
-                        template.path,
-                        template.name,
-                        templates[template.name].path,
-                    )
-                    continue
-                templates[template.name] = template
-            else:
-                for extension in self.extensions:
-                    for file_path in path.glob(f"*.{extension}"):
-                        template = Template(path=file_path.resolve())
-                        # TODO(Mateusz): raise warning in case of clash
-                        if template.name in templates:
-                            logger.warning(
-                                "Template name clash: %s and %s have the same name %s."
-                                "Proceeding with %s.",
-                                templates[template.name].path,
-                                template.path,
-                                template.name,
-                                templates[template.name].path,
-                            )
-                            continue
-
-                        templates[template.name] = template
-        return templates
-
-
-class RemoteConfiguration(BaseModel):
-    """Configuration for downloading remote templates.
-
-    Attributes:
-        timeout (int): The timeout value for the remote connection. Must be greater than 0.
-    """
-
-    timeout: Annotated[int, Gt(0)]
-    verify_ssl: bool
-
-
-class ImagesConfiguration(BaseModel):
-    """ImagesConfiguration is a configuration class for image-related settings.
-
-    Attributes:
-        templates (TemplatesConfiguration): Configuration for templates.
-    """
-
-    templates: TemplatesConfiguration
-    remote: RemoteConfiguration
-
-
-class TyperConfiguration(BaseModel):
-    """TyperConfiguration is a configuration class for Typer.
-
-    Attributes:
-        no_args_is_help (bool): If True, the application will display the help message
-        when no arguments are provided.
-    """
-
-    no_arg_is_help: bool
-
-
-class InterfaceConfiguration(BaseModel):
-    """InterfaceConfiguration is a model that holds the configuration settings for the interface.
-
-    Attributes:
-        typer (TyperConfiguration): Configuration settings for the typer.
-    """
-
-    typer: TyperConfiguration
-
-
-class Configuration(BaseModel):
-    """Configuration class that inherits from BaseModel.
-
-    Attributes:
-        text (Text): An instance of the Text class representing the text configuration.
-    """
-
-    text: TextConfiguration
-    images: ImagesConfiguration
-    interface: InterfaceConfiguration
-
-
-# SETTINGS FUNCTIONS ###
-# TODO(Mateusz): figure out how to correctly pass the type of the model
-# AnyMemerModel = TypeVar("AnyMemerModel", type[Configuration], type[DefaultMemes])  # noqa: ERA001
-
-
-def _log_yaml(dictionary: dict[str, Any]) -> None:
-    config_yaml = yaml.dump(dictionary, default_flow_style=False)
-    logger.debug("YAML configuration:\n%s", config_yaml)
-
-
-def _log_object(memer_model: BaseModel) -> None:
-    logger.debug("Model: %s", memer_model.model_dump_json(indent=4))
-
-
-ModelType = TypeVar("ModelType", bound=BaseModel)
-
-
-def _load_from_file(
-    file_path: Path,
-    target_class: type[ModelType],
-    *,
-    debug_log_on_load: bool = True,
-) -> ModelType:
-    try:
-        with file_path.open() as file:
-            config_data = yaml.safe_load(stream=file)
-            if debug_log_on_load:
-                _log_yaml(dictionary=config_data)
-            memer_model = target_class(**config_data)
-            if debug_log_on_load:
-                _log_object(memer_model=memer_model)
-            return memer_model
-    except FileNotFoundError:
-        message = f"Configuration file not found: {file_path}"
-        raise MissingConfigurationError(message) from FileNotFoundError
-
-
-def _dump_configuration_to_file(configuration: Configuration, file_path: Path) -> None:
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with file_path.open("w") as file:
-        yaml.dump(configuration.model_dump(), file)
-
-
-def get_config_path() -> Path:
-    """Returns the path to the configuration file.
-
-    This function constructs the path to the configuration file by using the
-    user configuration directory for the application and appending "config.yaml"
-    to it.
-
-    Returns:
-        Path: The full path to the configuration file.
-    """
-    return (Path(user_config_dir(appname=APP_NAME)) / "config.yaml").resolve()
-
-
-def load_configuration(config_path: Path | None = None) -> Configuration:
-    """Loads the configuration from a file.
-
-    If the configuration file is not found, it generates one from default settings and saves it.
-
-    Returns:
-        Configuration: The loaded or default configuration object.
-
-    Raises:
-        MissingConfigurationError: If the configuration file is missing and cannot be generated.
-    """
-    if config_path is None:
-        config_path = get_config_path()
-    try:
-        logger.debug("Loading configuration from %s", config_path)
-
-        return _load_from_file(file_path=config_path, target_class=Configuration)
-
-    except MissingConfigurationError:
-        logger.info(
-            "Configuration file not found under %s. Generating one from defaults",
-            config_path,
-        )
-        default_configuration = _load_from_file(
-            file_path=DEFAULT_CONFIGURATION_PATH, target_class=Configuration
-        )
-        dump_configuration(configuration=default_configuration)
-        return default_configuration
-
-
-def dump_configuration(configuration: Configuration) -> None:
-    """Dumps the given configuration to a file.
-
-    Args:
-        configuration (Configuration): The configuration object to be dumped.
-    """
-    # TODO(Mateusz): how to handle different versions?
-    # Maybe we should have a version field in the configuration.
-    # user_config_dir also can support version field
-    config_path = get_config_path()
-    _dump_configuration_to_file(configuration=configuration, file_path=config_path)
-
-
-def load_default_template_list(
-    file_path: Path = DEFAULT_MEMES_PATH,
-) -> list[TemplateToPull]:
-    """Loads the default memes from a file.
-
-    Returns:
-        DefaultMemes: The loaded default memes object.
-    """
-    return _load_from_file(file_path=file_path, target_class=ToPullTemplates).templates
-
-
-def get_user_data_templates_path() -> Path:
-    """Returns the resolved path to the user's data templates directory.
-
-    This function constructs the path to the "templates" directory within the
-    user's data directory for the application specified by APP_NAME.
-
-    Returns:
-        Path: The resolved path to the "templates" directory.
-    """
-    return Path(user_data_dir(appname=APP_NAME)).resolve() / "templates"
-
-
-# Global configuration is now managed through dependency injection
-# See memer.core.container for the new approach
+import json
+import logging
+import os
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Annotated
+from typing import Any
+from typing import TypeVar
+
+from annotated_types import Ge
+from annotated_types import Gt
+from platformdirs import user_config_dir
+from platformdirs import user_data_dir
+from pydantic import BaseModel
+from pydantic import Field
+from pydantic import PlainSerializer
+from pydantic import PrivateAttr
+from pydantic import field_validator
+
+from .helper_methods import convert_string_to_nice_name
+from .memer_exceptions import ConfigurationValidationError
+from .memer_exceptions import MissingConfigurationError
+
+if TYPE_CHECKING:
+    import hashlib
+
+logger = logging.getLogger(__name__)
+# TODO(Mateusz): this should probably go to setup.py?
+APP_NAME = "memer"
+
+# TODO(Mateusz): this file should be renamed to default_templates.yaml
+DEFAULT_MEMES_PATH = Path(__file__).parent.parent / "config" / "default_memes.yaml"
+
+DEFAULT_CONFIGURATION_PATH = (
+    Path(__file__).resolve().parent.parent / "config" / "default_configuration.yaml"
+)
+DEFAULT_FONT_PATH: Path = Path(__file__).resolve().parent.parent / "font"
+
+StringSerializedPath = Annotated[Path, PlainSerializer(lambda x: str(x), return_type=str)]
+
+# Translation table stripping separator characters from search bodies in one pass.
+_SEARCH_SANITIZE_TABLE = str.maketrans(dict.fromkeys("-_./\\ "))
+
+
+@cache
+def _yaml_safe_loader() -> type:
+    """Picks libyaml's C parser when the wheel ships it, otherwise the pure-Python one.
+
+    yaml is imported lazily so that commands that never read or write a
+    YAML file do not pay its import cost at startup.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@cache
+def _yaml_safe_dumper() -> type:
+    """Picks libyaml's C emitter when the wheel ships it, otherwise the pure-Python one.
+
+    model_dump only produces plain containers and scalars, so the safe
+    representer covers everything the configuration can hold.
+    """
+    import yaml
+
+    return getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# DEFAULT MEMES CLASSES
+@dataclass(frozen=True, slots=True)
+class TemplateToPull:
+    """MemeToPull is a dataclass representing a meme to be pulled.
+
+    Only consumed internally after loading trusted YAML, so a frozen
+    dataclass is enough: it gets tuple-based __eq__ and __hash__ for free
+    and skips pydantic's per-instance validation.
+
+    Attributes:
+        name (str | None): The name of the meme. It can be None if the name is not provided.
+        url (str): The URL of the meme.
+    """
+
+    name: str | None
+    # TODO(Mateusz): maybe HttpUrl is type?
+    url: str
+
+
+# DEFAULT SETTINGS CLASSES
+class MarginsConfiguration(BaseModel):
+    """Margins class represents the vertical and horizontal margins.
+
+    Attributes:
+        vertical (int): The vertical margin in pixels.
+        horizontal (int): The horizontal margin in pixels.
+    """
+
+    vertical: int
+    horizontal: int
+
+
+# Font resolution results shared across FontConfiguration instances (and thus
+# across configuration reloads). None records a miss, so a font absent from
+# every search path is not re-stated on each lookup.
+_font_path_cache: dict[tuple[str, str, tuple[str, ...]], Path | None] = {}
+
+
+class FontConfiguration(BaseModel):
+    """FontConfiguration is a class that represents the configuration for a font.
+
+    It includes fonts name, search paths, and file extension.
+
+    Attributes:
+        name (str): The name of the font. It can include (but does not have to) the file extension.
+        search_paths (list[Path]): An ordered, deduplicated list of paths to search
+            for the font file.
+        extension (str): The file extension of the font. Can be None
+
+    Methods:
+        _get_full_font_path(search_path: Path) -> Path:
+            Constructs the full path to the font file based on the search path and font name.
+        _font_exists(search_path: Path) -> bool:
+            Checks if the font file exists in the given search path.
+        font_path() -> Path:
+            Property that computes and returns the full path to the font file if it exists
+            in any of the search paths.
+            Raises FileNotFoundError if the font file is not found in any of the search paths.
+    """
+
+    name: str
+    search_paths: list[StringSerializedPath] = Field(default_factory=list)
+    extension: str | None = None
+
+    @field_validator("search_paths", mode="after")
+    @classmethod
+    def _dedup_search_paths(cls: type["FontConfiguration"], value: list[Path]) -> list[Path]:
+        """Deduplicates once at validation while keeping the configured order."""
+        return list(dict.fromkeys(value))
+
+    _resolved_font_path: Path | None = PrivateAttr(default=None)
+    _resolved_filename_cache: str | None = PrivateAttr(default=None)
+
+    @property
+    def _resolved_filename(self) -> str:
+        """The font file name with the extension applied, computed once.
+
+        Hoists the extension handling out of the per-search-path loop, so
+        each candidate path is a single `search_path / filename` join.
+        """
+        if self._resolved_filename_cache is None:
+            # Case: no extension configured, or the name already includes it
+            # (a bare name still could be a valid font path)
+            if self.extension is None or self.name.endswith(self.extension):
+                self._resolved_filename_cache = self.name
+            # Case: the extension includes the dot
+            elif self.extension.startswith("."):
+                self._resolved_filename_cache = f"{self.name}{self.extension}"
+            else:
+                self._resolved_filename_cache = f"{self.name}.{self.extension}"
+        return self._resolved_filename_cache
+
+    def _get_full_font_path(self, search_path: Path) -> Path:
+        return search_path / self._resolved_filename
+
+    def _font_exists(self, search_path: Path) -> bool:
+        return (search_path / self._resolved_filename).exists()
+
+    @property
+    def font_path(self) -> Path:
+        """Cached property for computed font path.
+
+        This property will search for the font file in the search paths and return the full path.
+        It will perform the search in the order from the settings.
+
+        Returns:
+            Path: The full path to the font if it exists in one of the search paths.
+
+        Raises:
+            ConfigurationValidationError: If the font is not found in any of the search paths.
+        """
+        if self._resolved_font_path is not None:
+            return self._resolved_font_path
+
+        error_message = f"Default font not found in any of the search paths. Looked at: {
+            DEFAULT_FONT_PATH} and at {self.search_paths}"
+
+        cache_key = (self.name, self.extension or "", tuple(map(str, self.search_paths)))
+        if cache_key in _font_path_cache:
+            cached_path = _font_path_cache[cache_key]
+            if cached_path is None:
+                raise ConfigurationValidationError(error_message)
+            self._resolved_font_path = cached_path
+            return cached_path
+
+        # First try the built in path
+        if self._font_exists(DEFAULT_FONT_PATH):
+            font_path = self._get_full_font_path(search_path=DEFAULT_FONT_PATH)
+            _font_path_cache[cache_key] = font_path
+            self._resolved_font_path = font_path
+            return font_path
+
+        # Then try the search paths
+        for path in self.search_paths:
+            if self._font_exists(path):
+                font_path = self._get_full_font_path(search_path=path)
+                _font_path_cache[cache_key] = font_path
+                self._resolved_font_path = font_path
+                return font_path
+
+        _font_path_cache[cache_key] = None
+        raise ConfigurationValidationError(error_message)
+
+
+class TextConfiguration(BaseModel):
+    """Text class represents the text configuration.
+
+    Attributes:
+        max_text_to_height_ratio (float): The maximum text to height ratio.
+        margins (Margins): An instance of the Margins class representing the margins configuration.
+        stroke_width (int): The width of the contrast stroke around the text.
+            0 disables the stroke, which makes drawing considerably cheaper.
+        stroke_fill (str): The color of the contrast stroke.
+    """
+
+    max_text_to_height_ratio: float
+    margins: MarginsConfiguration
+    font: FontConfiguration
+    stroke_width: Annotated[int, Ge(0)] = 2
+    stroke_fill: str = "black"
+
+
+@cache
+def _template_key_hasher() -> "hashlib.blake2b":
+    """A prebuilt BLAKE2b hasher copied per Template.key computation.
+
+    copy() of a prepared hasher skips re-running the parameterized
+    constructor for every template.
+    """
+    import hashlib
+
+    return hashlib.blake2b(digest_size=8)
+
+
+class Template(BaseModel):
+    """Template class representing a template file with a path.
+
+    Attributes:
+        path (Path): The file path of the template.
+
+    Properties:
+        name (str): A computed property that returns a nicely formatted name
+        derived from the file stem.
+        key (str): A computed property that returns a short hash of the file path,
+        which remains consistent if the path does not change.
+    """
+
+    # TODO(Mateusz): think about it. Should it even be pydantic base class?
+    path: StringSerializedPath
+
+    # Computed values cached in private attrs so that they stay out of
+    # model_dump and survive model_copy, unlike functools.cached_property
+    # entries living in __dict__.
+    _name_cache: str | None = PrivateAttr(default=None)
+    _key_cache: str | None = PrivateAttr(default=None)
+    _search_body_cache: str | None = PrivateAttr(default=None)
+    _sanitized_search_body_cache: str | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_discovered(cls: type["Template"], path: Path, name: str) -> "Template":
+        """Builds a template for a path found by the discovery scan.
+
+        The scan already holds a Path and has computed the display name for
+        the clash check, so validation and the name recomputation are skipped.
+
+        Args:
+            path (Path): The template file path.
+            name (str): The precomputed user-friendly name.
+
+        Returns:
+            Template: The constructed template.
+        """
+        template = cls.model_construct(path=path)
+        # Seeding the class's own private attr; SLF001 cannot tell that
+        # `template` is an instance of `cls`.
+        template._name_cache = name  # noqa: SLF001
+        return template
+
+    @property
+    def name(self) -> str:
+        """A user-friendly name from the file stem of the path.
+
+        Returns:
+            str: A user-friendly name derived from the file stem.
+        """
+        if self._name_cache is None:
+            self._name_cache = convert_string_to_nice_name(source_name=self.path.stem)
+        return self._name_cache
+
+    @property
+    def key(self) -> str:
+        # TODO(Mateusz): do we even need it?
+        """Property will stay the same if the path did not change.
+
+        Generates a short BLAKE2b hash of the file path. blake2b with a small
+        digest is markedly cheaper than SHA-256 on these tiny inputs, and
+        os.fsencode skips the str round trip.
+
+        Returns:
+            str: A 16-character BLAKE2b hash of the file path.
+        """
+        if self._key_cache is None:
+            hasher = _template_key_hasher().copy()
+            hasher.update(os.fsencode(self.path))
+            self._key_cache = hasher.digest().hex()
+        return self._key_cache
+
+    @property
+    def stem(self) -> str:
+        """The file stem of the path.
+
+        Returns:
+            str: The file stem of the path.
+        """
+        return self.path.stem
+
+    @property
+    def search_body(self) -> str:
+        """Lowercased concatenation of the name, key and path used for searching.
+
+        Computed once per template so that repeated searches do not rebuild it.
+
+        Returns:
+            str: The lowercased search body.
+        """
+        if self._search_body_cache is None:
+            self._search_body_cache = (self.name + self.key + str(self.path)).lower()
+        return self._search_body_cache
+
+    @property
+    def sanitized_search_body(self) -> str:
+        """The search body with separator characters stripped out.
+
+        Allows a search phrase like "thislittlemaneuver" to match
+        "this_little_maneuver.png".
+
+        Returns:
+            str: The sanitized search body.
+        """
+        if self._sanitized_search_body_cache is None:
+            self._sanitized_search_body_cache = self.search_body.translate(_SEARCH_SANITIZE_TABLE)
+        return self._sanitized_search_body_cache
+
+
+@cache
+def _template_index_path() -> Path:
+    return Path(user_data_dir(appname=APP_NAME)) / "template_index.json"
+
+
+def _read_template_index(index_path: Path, fingerprint: dict[str, Any]) -> list[str] | None:
+    """Returns the cached template paths, or None when stale or unreadable."""
+    try:
+        with index_path.open() as file:
+            index = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if index.get("fingerprint") != fingerprint:
+        return None
+    template_paths = index.get("templates")
+    return template_paths if isinstance(template_paths, list) else None
+
+
+def _write_template_index(
+    index_path: Path, fingerprint: dict[str, Any], template_paths: list[str]
+) -> None:
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with index_path.open("w") as file:
+            json.dump({"fingerprint": fingerprint, "templates": template_paths}, file)
+    except OSError:
+        # The index is only an optimization; failing to persist it is fine.
+        logger.debug("Could not write template index to %s", index_path)
+
+
+class TemplatesConfiguration(BaseModel):
+    """TemplatesConfiguration is a configuration class for managing template discovery.
+
+    Attributes:
+        extensions (list[str]): A list of file extensions to search for templates.
+        search_paths (list[Path]): A list of paths to search for template files.
+
+    Methods:
+        discovered_templates() -> dict[str, Template]:
+            Property with templates that are discovered from the search paths and extensions.
+    """
+
+    extensions: list[str]
+    search_paths: list[StringSerializedPath] = Field(default_factory=list)
+
+    _discovered_templates_cache: dict[str, Template] | None = PrivateAttr(default=None)
+
+    @field_validator("search_paths", mode="after")
+    @classmethod
+    def _dedup_search_paths(cls: type["TemplatesConfiguration"], value: list[Path]) -> list[Path]:
+        """Deduplicates once at validation while keeping the configured order."""
+        return list(dict.fromkeys(value))
+
+    @property
+    def discovered_templates(self) -> dict[str, Template]:
+        """Property with templates that are discovered from the search paths and extensions.
+
+        Discovers and loads templates from the specified search paths and extensions.
+        This method iterates over the configured search paths and file extensions,
+        creating a Template object for each discovered file and storing it in a dictionary
+        with the template's key as the dictionary key.
+
+        Returns:
+            dict[str, Template]: A dictionary where the keys are template names and the values
+            are Template objects.
+        """
+        if self._discovered_templates_cache is not None:
+            return self._discovered_templates_cache
+
+        index_path = _template_index_path()
+        fingerprint = self._scan_fingerprint()
+        cached_paths = _read_template_index(index_path=index_path, fingerprint=fingerprint)
+        if cached_paths is not None:
+            # Name clashes were already resolved (and warned about) when the
+            # index was written, so the cached paths can be used as-is.
+            self._discovered_templates_cache = {
+                template.name: template
+                for template in (Template(path=Path(path)) for path in cached_paths)
+            }
+            return self._discovered_templates_cache
+
+        templates: dict[str, Template] = {}
+        # TODO(Mateusz): refactor this to maybe use a generator. Also too much nesting
+        # This is really tought to understad
+        suffixes = {f".{extension.lower().lstrip('.')}" for extension in self.extensions}
+        for path in self.search_paths:
+            # Case that path is a file already
+            if path.is_file():
+                name = convert_string_to_nice_name(source_name=path.stem)
+                existing = templates.get(name)
+                if existing is not None:
+                    logger.warning(
+                        "Template name clash: %s and %s have the same name %s."
+                        "Proceeding with %s.",
+                        existing.path,
+                        path,
+                        name,
+                        existing.path,
+                    )
+                    continue
+                templates[name] = Template.from_discovered(path=path, name=name)
+            else:
+                # One scandir pass per directory: DirEntry.is_file() reuses the
+                # type information from the directory listing, so no per-file
+                # stat is needed (unlike one glob pass per extension).
+                try:
+                    with os.scandir(path) as entries:
+                        # entry.path is already the full path under the search
+                        # dir; no per-file resolve() needed.
+                        file_paths = [
+                            Path(entry.path)
+                            for entry in entries
+                            if os.path.splitext(entry.name)[1].lower() in suffixes  # noqa: PTH122
+                            and entry.is_file()
+                        ]
+                except OSError:
+                    # Missing or unreadable search paths are skipped, matching
+                    # the old glob behaviour.
+                    continue
+                for file_path in file_paths:
+                    # Clash check first: a clashing file should not pay for
+                    # model construction that is immediately discarded.
+                    name = convert_string_to_nice_name(source_name=file_path.stem)
+                    existing = templates.get(name)
+                    if existing is not None:
+                        logger.warning(
+                            "Template name clash: %s and %s have the same name %s."
+                            "Proceeding with %s.",
+                            existing.path,
+                            file_path,
+                            name,
+                            existing.path,
+                        )
+                        continue
+
+                    templates[name] = Template.from_discovered(path=file_path, name=name)
+        _write_template_index(
+            index_path=index_path,
+            fingerprint=fingerprint,
+            template_paths=[str(template.path) for template in templates.values()],
+        )
+        self._discovered_templates_cache = templates
+        return templates
+
+    def _scan_fingerprint(self) -> dict[str, Any]:
+        """Fingerprint of the scan inputs used to validate the on-disk index.
+
+        A search path's mtime changes whenever entries are added to or removed
+        from it, so comparing mtimes detects a stale index without rescanning.
+
+        Returns:
+            dict[str, Any]: The configured extensions plus each search path's
+            mtime in nanoseconds (None for missing paths).
+        """
+        search_path_mtimes: dict[str, int | None] = {}
+        for path in self.search_paths:
+            try:
+                search_path_mtimes[str(path)] = path.stat().st_mtime_ns
+            except OSError:
+                search_path_mtimes[str(path)] = None
+        return {
+            "extensions": sorted(self.extensions),
+            "search_paths": search_path_mtimes,
+        }
+
+
+class RemoteConfiguration(BaseModel):
+    """Configuration for downloading remote templates.
+
+    Attributes:
+        timeout (int): The timeout value for the remote connection. Must be greater than 0.
+        verify_ssl (bool): Whether to verify SSL certificates.
+        max_workers (int): How many templates to download concurrently. Must be greater than 0.
+    """
+
+    timeout: Annotated[int, Gt(0)]
+    verify_ssl: bool
+    max_workers: Annotated[int, Gt(0)] = 8
+
+
+class ImagesConfiguration(BaseModel):
+    """ImagesConfiguration is a configuration class for image-related settings.
+
+    Attributes:
+        templates (TemplatesConfiguration): Configuration for templates.
+    """
+
+    templates: TemplatesConfiguration
+    remote: RemoteConfiguration
+
+
+class TyperConfiguration(BaseModel):
+    """TyperConfiguration is a configuration class for Typer.
+
+    Attributes:
+        no_args_is_help (bool): If True, the application will display the help message
+        when no arguments are provided.
+    """
+
+    no_arg_is_help: bool
+
+
+class InterfaceConfiguration(BaseModel):
+    """InterfaceConfiguration is a model that holds the configuration settings for the interface.
+
+    Attributes:
+        typer (TyperConfiguration): Configuration settings for the typer.
+    """
+
+    typer: TyperConfiguration
+
+
+class Configuration(BaseModel):
+    """Configuration class that inherits from BaseModel.
+
+    Attributes:
+        text (Text): An instance of the Text class representing the text configuration.
+    """
+
+    text: TextConfiguration
+    images: ImagesConfiguration
+    interface: InterfaceConfiguration
+
+
+# SETTINGS FUNCTIONS ###
+# TODO(Mateusz): figure out how to correctly pass the type of the model
+# AnyMemerModel = TypeVar("AnyMemerModel", type[Configuration], type[DefaultMemes])  # noqa: ERA001
+
+
+def _log_yaml(dictionary: dict[str, Any]) -> None:
+    # Emitting the whole config through yaml.dump is pure waste when the
+    # message would be discarded anyway.
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    import yaml
+
+    config_yaml = yaml.dump(dictionary, default_flow_style=False)
+    logger.debug("YAML configuration:\n%s", config_yaml)
+
+
+def _log_object(memer_model: BaseModel) -> None:
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    logger.debug("Model: %s", memer_model.model_dump_json(indent=4))
+
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+def _load_from_file(
+    file_path: Path,
+    target_class: type[ModelType],
+    *,
+    debug_log_on_load: bool = True,
+) -> ModelType:
+    import yaml
+
+    try:
+        with file_path.open() as file:
+            config_data = yaml.load(stream=file, Loader=_yaml_safe_loader())  # noqa: S506
+            if debug_log_on_load:
+                _log_yaml(dictionary=config_data)
+            # model_validate hands the parsed mapping straight to pydantic's
+            # Rust core instead of unpacking it through __init__ keyword args.
+            memer_model = target_class.model_validate(config_data)
+            if debug_log_on_load:
+                _log_object(memer_model=memer_model)
+            return memer_model
+    except FileNotFoundError:
+        message = f"Configuration file not found: {file_path}"
+        raise MissingConfigurationError(message) from FileNotFoundError
+
+
+def _dump_configuration_to_file(configuration: Configuration, file_path: Path) -> None:
+    import yaml
+
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with file_path.open("w") as file:
+        yaml.dump(configuration.model_dump(), file, Dumper=_yaml_safe_dumper())
+
+
+@cache
+def get_config_path() -> Path:
+    """Returns the path to the configuration file.
+
+    This function constructs the path to the configuration file by using the
+    user configuration directory for the application and appending "config.yaml"
+    to it. The result is constant per process, so it is computed at most once.
+
+    Returns:
+        Path: The full path to the configuration file.
+    """
+    return (Path(user_config_dir(appname=APP_NAME)) / "config.yaml").resolve()
+
+
+@cache
+def _load_default_configuration() -> Configuration:
+    """Loads the bundled default configuration, parsed at most once per process."""
+    return _load_from_file(file_path=DEFAULT_CONFIGURATION_PATH, target_class=Configuration)
+
+
+# (path, st_mtime_ns, configuration) of the most recently loaded user config.
+_cached_user_configuration: tuple[Path, int, Configuration] | None = None
+
+
+def load_configuration(config_path: Path | None = None) -> Configuration:
+    """Loads the configuration from a file.
+
+    If the configuration file is not found, it generates one from default settings and saves it.
+
+    Repeated calls in the same process reuse the parsed configuration as long
+    as the file's mtime has not changed.
+
+    Returns:
+        Configuration: The loaded or default configuration object.
+
+    Raises:
+        MissingConfigurationError: If the configuration file is missing and cannot be generated.
+    """
+    global _cached_user_configuration  # noqa: PLW0603
+    if config_path is None:
+        config_path = get_config_path()
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+
+    if (
+        mtime_ns is not None
+        and _cached_user_configuration is not None
+        and _cached_user_configuration[:2] == (config_path, mtime_ns)
+    ):
+        return _cached_user_configuration[2]
+
+    try:
+        logger.debug("Loading configuration from %s", config_path)
+
+        configuration = _load_from_file(file_path=config_path, target_class=Configuration)
+
+    except MissingConfigurationError:
+        logger.info(
+            "Configuration file not found under %s. Generating one from defaults",
+            config_path,
+        )
+        default_configuration = _load_default_configuration()
+        dump_configuration(configuration=default_configuration)
+        return default_configuration
+
+    if mtime_ns is not None:
+        _cached_user_configuration = (config_path, mtime_ns, configuration)
+    return configuration
+
+
+def dump_configuration(configuration: Configuration) -> None:
+    """Dumps the given configuration to a file.
+
+    Args:
+        configuration (Configuration): The configuration object to be dumped.
+    """
+    # TODO(Mateusz): how to handle different versions?
+    # Maybe we should have a version field in the configuration.
+    # user_config_dir also can support version field
+    config_path = get_config_path()
+    _dump_configuration_to_file(configuration=configuration, file_path=config_path)
+
+
+@cache
+def load_default_template_list(
+    file_path: Path = DEFAULT_MEMES_PATH,
+) -> list[TemplateToPull]:
+    """Loads the default memes from a file.
+
+    Parsed once per (process, file path); the bundled list never changes
+    within a run.
+
+    Returns:
+        list[TemplateToPull]: The loaded template list.
+
+    Raises:
+        MissingConfigurationError: If the file does not exist.
+        ConfigurationValidationError: If the file is not a mapping with a
+            "templates" list of entries that each carry a "url".
+    """
+    # The template list is flat str fields only, so after the explicit shape
+    # checks below the dataclasses are built straight from the parsed YAML,
+    # skipping pydantic validation of potentially hundreds of entries.
+    import yaml
+
+    try:
+        with file_path.open() as file:
+            template_data = yaml.load(stream=file, Loader=_yaml_safe_loader())  # noqa: S506
+    except FileNotFoundError:
+        message = f"Configuration file not found: {file_path}"
+        raise MissingConfigurationError(message) from FileNotFoundError
+    entries = template_data.get("templates") if isinstance(template_data, dict) else None
+    if not isinstance(entries, list):
+        message = f"Template list {file_path} must have a top-level 'templates' list"
+        raise ConfigurationValidationError(message)
+    templates: list[TemplateToPull] = []
+    for index, template in enumerate(entries):
+        if not isinstance(template, dict) or "url" not in template:
+            message = (
+                f"Template entry {index} in {file_path} must be a mapping with a 'url': "
+                f"{template!r}"
+            )
+            raise ConfigurationValidationError(message)
+        templates.append(TemplateToPull(name=template.get("name"), url=template["url"]))
+    return templates
+
+
+@cache
+def get_user_data_templates_path() -> Path:
+    """Returns the resolved path to the user's data templates directory.
+
+    This function constructs the path to the "templates" directory within the
+    user's data directory for the application specified by APP_NAME. The
+    result is constant per process, so it is computed at most once.
+
+    Returns:
+        Path: The resolved path to the "templates" directory.
+    """
+    return Path(user_data_dir(appname=APP_NAME)).resolve() / "templates"
+
+
+# Global configuration is now managed through dependency injection
+# See memer.core.container for the new approach
@@ -0,0 +1,53 @@
+"""Tests for image utilities."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PIL import Image
+
+from memer.utils.images import MemeText
+from memer.utils.images import _unique_output_paths
+from memer.utils.images import create_memes_batch
+from memer.utils.settings import TextConfiguration
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _text_configuration() -> TextConfiguration:
+    """Create a minimal text configuration using the bundled font."""
+    return TextConfiguration.model_validate(
+        {
+            "max_text_to_height_ratio": 0.3,
+            "margins": {"vertical": 10, "horizontal": 10},
+            "font": {"name": "Anton-Regular", "extension": "ttf"},
+        }
+    )
+
+
+def test_unique_output_paths_suffixes_clashing_names(temp_dir: Path) -> None:
+    """Test that jobs sharing a template stem get distinct output paths."""
+    template = temp_dir / "same_template.png"
+    jobs = [(template, MemeText(top_text=f"Text {index}")) for index in range(3)]
+
+    output_paths = _unique_output_paths(jobs=jobs, out_dir=temp_dir)
+
+    assert len(set(output_paths)) == len(jobs)
+
+
+def test_create_memes_batch_repeated_template(temp_dir: Path) -> None:
+    """Test that a batch reusing one template writes every meme."""
+    template = temp_dir / "same_template.png"
+    Image.new("RGB", (200, 200), "white").save(template)
+    jobs = [(template, MemeText(top_text=f"Text {index}")) for index in range(3)]
+
+    saved_paths = create_memes_batch(
+        jobs=jobs,
+        text_configuration=_text_configuration(),
+        out_dir=temp_dir,
+        max_workers=2,
+    )
+
+    assert len(set(saved_paths)) == len(jobs)
+    assert all(saved_path.is_file() for saved_path in saved_paths)
@@ -0,0 +1,144 @@
+"""Tests for template discovery caching and template list loading."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from memer.utils import settings
+from memer.utils.memer_exceptions import ConfigurationValidationError
+from memer.utils.settings import TemplatesConfiguration
+from memer.utils.settings import load_default_template_list
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _configuration(template_dir: Path, extensions: list[str]) -> TemplatesConfiguration:
+    """Create a templates configuration scanning a single directory."""
+    return TemplatesConfiguration(extensions=extensions, search_paths=[template_dir])
+
+
+def _use_index_path(monkeypatch: pytest.MonkeyPatch, index_path: Path) -> None:
+    """Point the module at a per-test index file."""
+    monkeypatch.setattr(settings, "_template_index_path", lambda: index_path)
+
+
+def test_discovery_writes_index(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a scan persists the discovered paths to the index."""
+    template_dir = temp_dir / "templates"
+    template_dir.mkdir()
+    (template_dir / "first_meme.png").write_bytes(b"x")
+    index_path = temp_dir / "template_index.json"
+    _use_index_path(monkeypatch, index_path)
+
+    templates = _configuration(template_dir, ["png"]).discovered_templates
+
+    assert sorted(templates) == ["First Meme"]
+    index = json.loads(index_path.read_text())
+    assert index["templates"] == [str(template_dir / "first_meme.png")]
+
+
+def test_discovery_reads_from_valid_index(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an index with a matching fingerprint short-circuits the scan."""
+    template_dir = temp_dir / "templates"
+    template_dir.mkdir()
+    (template_dir / "first_meme.png").write_bytes(b"x")
+    index_path = temp_dir / "template_index.json"
+    _use_index_path(monkeypatch, index_path)
+    assert sorted(_configuration(template_dir, ["png"]).discovered_templates) == ["First Meme"]
+
+    # Tamper with the cached paths while keeping the fingerprint valid: the
+    # tampered entry surfacing proves the scan was skipped.
+    index = json.loads(index_path.read_text())
+    index["templates"] = [str(template_dir / "planted_meme.png")]
+    index_path.write_text(json.dumps(index))
+
+    templates = _configuration(template_dir, ["png"]).discovered_templates
+
+    assert sorted(templates) == ["Planted Meme"]
+
+
+def test_index_invalidated_by_search_path_mtime(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that changing a search path's contents forces a rescan."""
+    template_dir = temp_dir / "templates"
+    template_dir.mkdir()
+    (template_dir / "first_meme.png").write_bytes(b"x")
+    index_path = temp_dir / "template_index.json"
+    _use_index_path(monkeypatch, index_path)
+    assert sorted(_configuration(template_dir, ["png"]).discovered_templates) == ["First Meme"]
+
+    # Adding a file bumps the directory mtime, so the fingerprint no longer
+    # matches and the stale index must not be served.
+    (template_dir / "second_meme.png").write_bytes(b"x")
+
+    templates = _configuration(template_dir, ["png"]).discovered_templates
+
+    assert sorted(templates) == ["First Meme", "Second Meme"]
+
+
+def test_index_invalidated_by_extension_change(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that changing the configured extensions forces a rescan."""
+    template_dir = temp_dir / "templates"
+    template_dir.mkdir()
+    (template_dir / "first_meme.png").write_bytes(b"x")
+    (template_dir / "second_meme.jpg").write_bytes(b"x")
+    index_path = temp_dir / "template_index.json"
+    _use_index_path(monkeypatch, index_path)
+
+    assert sorted(_configuration(template_dir, ["png"]).discovered_templates) == ["First Meme"]
+
+    templates = _configuration(template_dir, ["png", "jpg"]).discovered_templates
+
+    assert sorted(templates) == ["First Meme", "Second Meme"]
+
+
+def test_corrupt_index_falls_back_to_scan(temp_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that an unreadable index is ignored and rewritten."""
+    template_dir = temp_dir / "templates"
+    template_dir.mkdir()
+    (template_dir / "first_meme.png").write_bytes(b"x")
+    index_path = temp_dir / "template_index.json"
+    index_path.write_text("{not valid json")
+    _use_index_path(monkeypatch, index_path)
+
+    templates = _configuration(template_dir, ["png"]).discovered_templates
+
+    assert sorted(templates) == ["First Meme"]
+    assert json.loads(index_path.read_text())["templates"] == [str(template_dir / "first_meme.png")]
+
+
+def test_load_template_list_from_user_file(temp_dir: Path) -> None:
+    """Test that a well-formed user file loads name and url."""
+    list_path = temp_dir / "templates.yaml"
+    list_path.write_text("templates:\n  - name: First\n    url: https://example.com/first.png\n")
+
+    templates = load_default_template_list(list_path)
+
+    assert [(template.name, template.url) for template in templates] == [
+        ("First", "https://example.com/first.png")
+    ]
+
+
+def test_load_template_list_without_templates_key(temp_dir: Path) -> None:
+    """Test that a file without a top-level templates list is rejected."""
+    list_path = temp_dir / "templates.yaml"
+    list_path.write_text("memes:\n  - url: https://example.com/first.png\n")
+
+    with pytest.raises(ConfigurationValidationError, match="top-level 'templates' list"):
+        load_default_template_list(list_path)
+
+
+def test_load_template_list_entry_without_url(temp_dir: Path) -> None:
+    """Test that an entry missing its url is named in the error."""
+    list_path = temp_dir / "templates.yaml"
+    list_path.write_text("templates:\n  - name: First\n")
+
+    with pytest.raises(ConfigurationValidationError, match="Template entry 0"):
+        load_default_template_list(list_path)